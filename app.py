@@ -1,5 +1,8 @@
 import streamlit as st
+import bisect
 import sqlite3
+import threading
+from contextlib import contextmanager
 import pandas as pd
 from datetime import date
 
@@ -9,35 +12,142 @@ from datetime import date
 st.set_page_config(page_title="Classroom Reflection", layout="wide")
 DB_PATH = "teacher_engagement.db"
 
+# DATE columns round-trip as datetime.date (explicit, the sqlite3 defaults are deprecated)
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+
 # -----------------------------
 # DATABASE
 # -----------------------------
-def get_connection():
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
+@st.cache_resource
+def get_conn():
+    """
+    One process-wide connection, reused across reruns and sessions
+    """
+    conn = sqlite3.connect(
+        DB_PATH,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        isolation_level=None
+    )
+    # WAL keeps dashboard reads from blocking reflection inserts
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    return conn
+
+@st.cache_resource
+def get_write_lock():
+    """
+    Serializes writes on the shared connection across sessions
+    """
+    return threading.Lock()
+
+@contextmanager
+def write_transaction():
+    """
+    Takes the write lock and one BEGIN IMMEDIATE ... COMMIT around the block
+    """
+    conn = get_conn()
+    with get_write_lock():
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT can leave the shared connection mid-transaction
+            if conn.in_transaction:
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass  # keep the original exception
+            raise
+
+def table_columns(conn, table):
+    """
+    Returns {column name: is part of the primary key}, empty if the table is missing
+    """
+    return {r[1]: bool(r[5]) for r in conn.execute(f"PRAGMA table_info({table})")}
+
+def migrate_legacy_tables(conn):
+    """
+    Moves tables from databases created before the current schema out of the way,
+    so init_db can create them fresh
+    """
+    reflection_columns = table_columns(conn, "daily_reflections")
+    if reflection_columns and "class_size" not in reflection_columns:
+        # cei_score is a stored generated column now, which ALTER TABLE cannot add,
+        # so the table is recreated; any rows are copied back by init_db
+        if conn.execute("SELECT EXISTS(SELECT 1 FROM daily_reflections)").fetchone()[0]:
+            conn.execute("ALTER TABLE daily_reflections RENAME TO daily_reflections_legacy")
+        else:
+            conn.execute("DROP TABLE daily_reflections")
+
+    class_columns = table_columns(conn, "classes")
+    if class_columns and not any(class_columns.values()):
+        # Old classes table without a primary key; its rows are copied back by init_db
+        conn.execute("ALTER TABLE classes RENAME TO classes_legacy")
+
+# Columns a pre-class_size daily_reflections table may share with the current one
+LEGACY_REFLECTION_COLUMNS = (
+    "id", "school_id", "teacher_id", "class_id", "subject_id",
+    "session_date", "number_present",
+    "participation_level", "attentiveness_level",
+    "task_given", "topic", "note"
+)
+
+def copy_legacy_reflections(conn, legacy_columns):
+    """
+    Copies rows from daily_reflections_legacy, taking class_size from classes.
+    Rows without a matching class or without number_present stay behind
+    in the legacy table.
+    """
+    columns = [c for c in LEGACY_REFLECTION_COLUMNS if c in legacy_columns]
+    has_class = """
+        FROM classes c WHERE c.school_id = r.school_id
+        AND c.class_id = r.class_id AND c.subject_id = r.subject_id
+    """
+    copyable = f"r.number_present IS NOT NULL AND EXISTS (SELECT 1 {has_class})"
+    conn.executescript(f"""
+        BEGIN;
+        INSERT INTO daily_reflections ({", ".join(columns)}, class_size)
+        SELECT {", ".join("r." + c for c in columns)}, (SELECT c.class_size {has_class})
+        FROM daily_reflections_legacy r
+        WHERE {copyable};
+        DELETE FROM daily_reflections_legacy AS r WHERE {copyable};
+        COMMIT;
+    """)
+    if not conn.execute("SELECT EXISTS(SELECT 1 FROM daily_reflections_legacy)").fetchone()[0]:
+        conn.execute("DROP TABLE daily_reflections_legacy")
 
+@st.cache_resource
 def init_db():
-    conn = get_connection()
-    cur = conn.cursor()
+    """
+    Creates tables and indexes once per process, not on every rerun
+    """
+    conn = get_conn()
+    migrate_legacy_tables(conn)
+
+    conn.executescript("""
+        BEGIN;
 
-    cur.execute("""
         CREATE TABLE IF NOT EXISTS teachers (
             teacher_id TEXT,
             school_id TEXT,
             teacher_name TEXT,
             PRIMARY KEY (teacher_id, school_id)
-        )
-    """)
+        );
 
-    cur.execute("""
         CREATE TABLE IF NOT EXISTS classes (
             class_id TEXT,
             subject_id TEXT,
             school_id TEXT,
-            class_size INTEGER
-        )
-    """)
+            class_size INTEGER,
+            PRIMARY KEY (school_id, class_id, subject_id)
+        );
 
-    cur.execute("""
         CREATE TABLE IF NOT EXISTS daily_reflections (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             school_id TEXT,
@@ -45,30 +155,142 @@ def init_db():
             class_id TEXT,
             subject_id TEXT,
             session_date DATE,
-            number_present INTEGER,
+            number_present INTEGER NOT NULL,
             participation_level TEXT,
             attentiveness_level TEXT,
             task_given TEXT,
+            topic TEXT,
             note TEXT,
-            cei_score REAL
-        )
-    """)
+            class_size INTEGER,
+            -- Locked CEI scoring: 40% participation, 40% attentiveness, 20% presence
+            cei_score REAL GENERATED ALWAYS AS (
+                CASE WHEN class_size > 0 THEN ROUND(
+                    0.4 * CASE participation_level
+                        WHEN 'low' THEN 10 WHEN 'medium' THEN 25 WHEN 'high' THEN 40 ELSE 0
+                    END +
+                    0.4 * CASE attentiveness_level
+                        WHEN 'low' THEN 10 WHEN 'medium' THEN 25 WHEN 'high' THEN 40 ELSE 0
+                    END +
+                    0.2 * MIN((number_present * 1.0 / class_size) * 40, 40),
+                    2
+                ) ELSE 0 END
+            ) STORED
+        );
 
-    cur.execute("""
         CREATE TABLE IF NOT EXISTS weekly_reflections (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             school_id TEXT,
             teacher_id TEXT,
             week INTEGER,
             reflection TEXT
-        )
+        );
+
+        CREATE INDEX IF NOT EXISTS ix_reflections_lookup
+        ON daily_reflections (school_id, teacher_id, class_id, subject_id, session_date);
+
+        COMMIT;
     """)
 
-    conn.commit()
-    conn.close()
+    if table_columns(conn, "classes_legacy"):
+        # Copy over classes from a pre-primary-key table, dropping duplicates
+        conn.executescript("""
+            BEGIN;
+            INSERT OR IGNORE INTO classes (class_id, subject_id, school_id, class_size)
+            SELECT class_id, subject_id, school_id, class_size FROM classes_legacy;
+            DROP TABLE classes_legacy;
+            COMMIT;
+        """)
+
+    legacy_columns = table_columns(conn, "daily_reflections_legacy")
+    if legacy_columns:
+        copy_legacy_reflections(conn, legacy_columns)
 
 init_db()
 
+# -----------------------------
+# CACHED QUERIES
+# -----------------------------
+@st.cache_data(ttl=60, show_spinner=False)
+def load_classes(school_id):
+    """
+    Returns (labels, by_label): selectbox labels and the class row behind each
+    """
+    rows = get_conn().execute(
+        "SELECT class_id, subject_id, class_size FROM classes WHERE school_id=?",
+        (school_id,)
+    ).fetchall()
+    by_label = {f"{r[0]} - {r[1]}": r for r in rows}
+    return list(by_label), by_label
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_reflection_classes(school_id, teacher_id):
+    rows = get_conn().execute(
+        "SELECT DISTINCT class_id FROM daily_reflections WHERE school_id=? AND teacher_id=?",
+        (school_id, teacher_id)
+    ).fetchall()
+    return [r[0] for r in rows]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_reflection_subjects(school_id, teacher_id, class_id):
+    rows = get_conn().execute(
+        "SELECT DISTINCT subject_id FROM daily_reflections "
+        "WHERE school_id=? AND teacher_id=? AND class_id=?",
+        (school_id, teacher_id, class_id)
+    ).fetchall()
+    return [r[0] for r in rows]
+
+def latest_reflection_id(school_id, teacher_id, class_id, subject_id):
+    """
+    Cheap index lookup used as the cache key for load_cei_trend
+    """
+    return get_conn().execute(
+        "SELECT MAX(id) FROM daily_reflections "
+        "WHERE school_id=? AND teacher_id=? AND class_id=? AND subject_id=?",
+        (school_id, teacher_id, class_id, subject_id)
+    ).fetchone()[0]
+
+@st.cache_data(show_spinner=False)
+def load_cei_trend(school_id, teacher_id, class_id, subject_id, last_id):
+    """
+    CEI series indexed by session_date, ready for st.line_chart.
+    last_id only keys the cache: a new reflection changes it.
+    """
+    df = pd.read_sql(
+        "SELECT session_date, cei_score FROM daily_reflections "
+        "WHERE school_id=? AND teacher_id=? AND class_id=? AND subject_id=? "
+        "ORDER BY session_date",
+        get_conn(),
+        params=(school_id, teacher_id, class_id, subject_id),
+        parse_dates=["session_date"]
+    )
+    return df.set_index("session_date")["cei_score"]
+
+def clear_reflection_caches():
+    load_reflection_classes.clear()
+    load_reflection_subjects.clear()
+    load_cei_trend.clear()
+
+def save_reflections(rows):
+    """
+    Inserts daily reflection rows in one transaction.
+    Each row is ordered as the column list below.
+    Returns the stored cei_score of the last row.
+    """
+    with write_transaction() as conn:
+        conn.executemany("""
+            INSERT INTO daily_reflections (
+                school_id, teacher_id, class_id, subject_id,
+                session_date, number_present,
+                participation_level, attentiveness_level,
+                task_given, topic, note, class_size
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        cei = conn.execute(
+            "SELECT cei_score FROM daily_reflections WHERE id=last_insert_rowid()"
+        ).fetchone()[0]
+    clear_reflection_caches()
+    return cei
+
 # -----------------------------
 # SESSION STATE
 # -----------------------------
@@ -89,14 +311,11 @@ def login():
 
     if st.button("Continue"):
         if school_id and teacher_id and teacher_name:
-            conn = get_connection()
-            cur = conn.cursor()
-            cur.execute(
-                "INSERT OR IGNORE INTO teachers VALUES (?, ?, ?)",
-                (teacher_id, school_id, teacher_name)
-            )
-            conn.commit()
-            conn.close()
+            with write_transaction() as conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO teachers VALUES (?, ?, ?)",
+                    (teacher_id, school_id, teacher_name)
+                )
 
             st.session_state.school_id = school_id
             st.session_state.teacher_id = teacher_id
@@ -111,55 +330,28 @@ if not st.session_state.teacher_id:
 # -----------------------------
 # CORE LOGIC
 # -----------------------------
-# Locked CEI scoring
-CEI_WEIGHTS = {
-    "participation": 0.4,   # 40% of CEI
-    "attentiveness": 0.4,   # 40%
-    "presence": 0.2          # 20%
-}
-
-CEI_LEVEL_SCORES = {
-    "low": 10,
-    "medium": 25,
-    "high": 40
-}
-
-def compute_cei(participation, attentiveness, present, class_size):
-    """
-    Returns CEI score for a single class session
-    """
-    if class_size <= 0:
-        return 0
-
-    part_score = CEI_LEVEL_SCORES.get(participation, 0)
-    att_score  = CEI_LEVEL_SCORES.get(attentiveness, 0)
-    presence_score = min((present / class_size) * CEI_LEVEL_SCORES["high"], CEI_LEVEL_SCORES["high"])
-
-    cei = round(
-        CEI_WEIGHTS["participation"]*part_score +
-        CEI_WEIGHTS["attentiveness"]*att_score +
-        CEI_WEIGHTS["presence"]*presence_score,
-        2
-    )
-
-    return cei
+# Allowed reflection values, shared by the daily form and the CSV import
+LEVEL_OPTIONS = ["low", "medium", "high"]
+TASK_OPTIONS = ["none", "classwork", "assignment", "test"]
 
 # Locked Engagement Interpretation Rules
-ENGAGEMENT_RULES = [
-    {"min": 75, "max": 100, "status": "green", "message": "Class is responding well. Keep your current approach."},
-    {"min": 60, "max": 75, "status": "yellow", "message": "Engagement is fair. Small adjustments may help."},
-    {"min": 0,  "max": 60, "status": "red", "message": "Engagement is low. Consider changing pace or method."}
+# Band i covers _THRESHOLDS[i] <= avg < _THRESHOLDS[i + 1]
+_THRESHOLDS = [0, 60, 75, 100]
+_STATUSES = [
+    ("red", "Engagement is low. Consider changing pace or method."),
+    ("yellow", "Engagement is fair. Small adjustments may help."),
+    ("green", "Class is responding well. Keep your current approach.")
 ]
 
-def interpret_engagement(series):
+def interpret_engagement(scores):
     """
-    Input: pandas Series of CEI scores for the filtered class
+    Input: numpy array of CEI scores for the filtered class
     Output: status color and message (locked)
     """
-    avg = series.mean() if not series.empty else 0
-    for rule in ENGAGEMENT_RULES:
-        if rule["min"] <= avg < rule["max"]:
-            return rule["status"], rule["message"]
+    avg = float(scores.mean()) if scores.size else 0.0
+    idx = bisect.bisect_right(_THRESHOLDS, avg) - 1
+    if 0 <= idx < len(_STATUSES):
+        return _STATUSES[idx]
     # fallback
     return "red", "Engagement data unclear. Please reflect more consistently."
 
@@ -177,13 +369,16 @@ def class_setup():
         submitted = st.form_submit_button("Add Class")
 
     if submitted:
-        conn = get_connection()
-        conn.execute(
-            "INSERT INTO classes VALUES (?, ?, ?, ?)",
-            (class_id, subject_id, st.session_state.school_id, class_size)
-        )
-        conn.commit()
-        conn.close()
+        try:
+            with write_transaction() as conn:
+                conn.execute(
+                    "INSERT INTO classes VALUES (?, ?, ?, ?)",
+                    (class_id, subject_id, st.session_state.school_id, class_size)
+                )
+        except sqlite3.IntegrityError:
+            st.error("This class and subject already exist")
+            return
+        load_classes.clear()
         st.success("Class added successfully")
 
 # -----------------------------
@@ -192,47 +387,39 @@ def class_setup():
 def daily_reflection():
     st.header("Daily Class Reflection")
 
-    conn = get_connection()
-    classes = pd.read_sql(
-        "SELECT * FROM classes WHERE school_id=?",
-        conn,
-        params=(st.session_state.school_id,)
-    )
-    conn.close()
+    labels, by_label = load_classes(st.session_state.school_id)
 
-    if classes.empty:
+    if not labels:
         st.info("Please add your classes first.")
         return
 
-    classes["label"] = classes["class_id"] + " - " + classes["subject_id"]
-
     with st.form("daily_form"):
-        selection = st.selectbox("Class / Subject", classes["label"].tolist())
-        row = classes[classes["label"] == selection].iloc[0]
+        selection = st.selectbox("Class / Subject", labels)
+        row = by_label[selection]
 
         session_date = st.date_input("Date", value=date.today())
         present = st.number_input(
             "Number present",
             min_value=0,
-            max_value=int(row["class_size"])
+            max_value=int(row[2])
         )
 
         participation = st.selectbox(
             "Participation level",
-            ["low", "medium", "high"],
+            LEVEL_OPTIONS,
             index=1,
             help="High: ≥30% active, Medium: some interaction, Low: mostly passive"
         )
 
         attentiveness = st.selectbox(
             "Attentiveness level",
-            ["low", "medium", "high"],
+            LEVEL_OPTIONS,
             index=1
         )
 
         task = st.selectbox(
             "Task given",
-            ["none", "classwork", "assignment", "test"]
+            TASK_OPTIONS
         )
 
         topic = st.text_area("Topic (today's topic?..)")
@@ -242,26 +429,11 @@ def daily_reflection():
         submitted = st.form_submit_button("Save Reflection")
 
     if submitted:
-        cei = compute_cei(
-            participation,
-            attentiveness,
-            present,
-            row["class_size"]
-        )
-
-        conn = get_connection()
-        conn.execute("""
-            INSERT INTO daily_reflections (
-                school_id, teacher_id, class_id, subject_id,
-                session_date, number_present,
-                participation_level, attentiveness_level,
-                task_given, note, topic, cei_score
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cei = save_reflections([(
             st.session_state.school_id,
             st.session_state.teacher_id,
-            row["class_id"],
-            row["subject_id"],
+            row[0],
+            row[1],
             session_date,
             present,
             participation,
@@ -269,59 +441,165 @@ def daily_reflection():
             task,
             topic,
             note,
-            cei
-        ))
-        conn.commit()
-        conn.close()
+            row[2]
+        )])
 
         st.success(f"Reflection saved. Engagement score: {cei}%")
 
+# -----------------------------
+# IMPORT REFLECTIONS
+# -----------------------------
+IMPORT_COLUMNS = [
+    "class_id", "subject_id", "session_date", "number_present",
+    "participation_level", "attentiveness_level",
+    "task_given", "topic", "note"
+]
+
+def import_reflections():
+    st.header("Import Reflections")
+
+    labels, by_label = load_classes(st.session_state.school_id)
+
+    if not labels:
+        st.info("Please add your classes first.")
+        return
+
+    class_sizes = {(r[0], r[1]): r[2] for r in by_label.values()}
+
+    upload = st.file_uploader(
+        "Reflections CSV",
+        type="csv",
+        help="Columns: " + ", ".join(IMPORT_COLUMNS)
+    )
+    if upload is None:
+        return
+
+    # Read everything as text so class "7" stays "7", then convert numbers explicitly
+    df = pd.read_csv(upload, dtype=str)
+
+    missing = [c for c in IMPORT_COLUMNS if c not in df.columns]
+    if missing:
+        st.error("Missing columns: " + ", ".join(missing))
+        return
+
+    df = df[IMPORT_COLUMNS].copy()
+
+    if df.empty:
+        st.info("The file has no reflections.")
+        return
+
+    unknown = {
+        f"{c} - {s}" for c, s in zip(df["class_id"], df["subject_id"])
+        if (c, s) not in class_sizes
+    }
+    if unknown:
+        st.error("Unknown classes: " + ", ".join(sorted(unknown)))
+        return
+
+    df["class_size"] = [class_sizes[(c, s)] for c, s in zip(df["class_id"], df["subject_id"])]
+    df["task_given"] = df["task_given"].fillna("none")
+    df[["topic", "note"]] = df[["topic", "note"]].fillna("")
+
+    # Same limits the daily form enforces through its widgets
+    session_dates = pd.to_datetime(df["session_date"], errors="coerce")
+    present = pd.to_numeric(df["number_present"], errors="coerce")
+    invalid = (
+        session_dates.isna()
+        | present.isna()
+        | (present % 1 != 0)
+        | (present < 0)
+        | (present > df["class_size"])
+        | ~df["participation_level"].isin(LEVEL_OPTIONS)
+        | ~df["attentiveness_level"].isin(LEVEL_OPTIONS)
+        | ~df["task_given"].isin(TASK_OPTIONS)
+    )
+    if invalid.any():
+        st.error(
+            "Some rows have invalid values. number_present must be a whole number "
+            "from 0 to the class size, levels one of " + ", ".join(LEVEL_OPTIONS) +
+            ", task_given one of " + ", ".join(TASK_OPTIONS) +
+            ", and session_date a valid date."
+        )
+        st.dataframe(df[invalid])
+        return
+
+    df["session_date"] = session_dates.dt.date
+    df["number_present"] = present.astype(int)
+
+    # At most one reflection per class per day, so re-uploading the same CSV can't double up
+    stored = set(get_conn().execute(
+        "SELECT class_id, subject_id, session_date FROM daily_reflections "
+        "WHERE school_id=? AND teacher_id=?",
+        (st.session_state.school_id, st.session_state.teacher_id)
+    ).fetchall())
+    keys = ["class_id", "subject_id", "session_date"]
+    duplicate = df.duplicated(keys, keep=False) | pd.Series(
+        [k in stored for k in zip(df["class_id"], df["subject_id"], df["session_date"])],
+        index=df.index
+    )
+    if duplicate.any():
+        st.error(
+            "Some rows repeat a class and date that is already saved or appears "
+            "more than once in the file."
+        )
+        st.dataframe(df[duplicate])
+        return
+
+    st.dataframe(df)
+
+    if st.button(f"Import {len(df)} reflections"):
+        save_reflections(
+            (st.session_state.school_id, st.session_state.teacher_id, *r)
+            for r in df.itertuples(index=False, name=None)
+        )
+        st.success(f"Imported {len(df)} reflections")
+
 # -----------------------------
 # DASHBOARD (FIXED)
 # -----------------------------
 def teacher_dashboard():
     st.header("Classroom Engagement Trend")
 
-    conn = get_connection()
-    df = pd.read_sql(
-        "SELECT * FROM daily_reflections WHERE school_id=? AND teacher_id=?",
-        conn,
-        params=(st.session_state.school_id, st.session_state.teacher_id)
+    classes = load_reflection_classes(
+        st.session_state.school_id,
+        st.session_state.teacher_id
     )
-    conn.close()
 
-    if df.empty:
+    if not classes:
         st.info("No reflections yet.")
         return
 
-    df["session_date"] = pd.to_datetime(df["session_date"])
-
     # ---- REQUIRED FILTER STEP ----
-    class_filter = st.selectbox("Select class", df["class_id"].unique())
-    subject_filter = st.selectbox(
-        "Select subject",
-        df[df["class_id"] == class_filter]["subject_id"].unique()
+    class_filter = st.selectbox("Select class", classes)
+    subjects = load_reflection_subjects(
+        st.session_state.school_id,
+        st.session_state.teacher_id,
+        class_filter
     )
+    subject_filter = st.selectbox("Select subject", subjects)
 
-    plot_df = df[
-        (df["class_id"] == class_filter) &
-        (df["subject_id"] == subject_filter)
-    ].sort_values("session_date")
+    filters = (
+        st.session_state.school_id,
+        st.session_state.teacher_id,
+        class_filter,
+        subject_filter
+    )
+    trend = load_cei_trend(*filters, latest_reflection_id(*filters))
 
     # ---- DEFENSIVE LOGIC ----
-    if plot_df.empty or len(plot_df) < 2:
+    if trend.empty or len(trend) < 2:
         st.info(
             "Not enough entries yet to show a clear pattern. "
             "Keep reflecting over the next few days."
         )
-        st.line_chart(plot_df.set_index("session_date")["cei_score"])
+        st.line_chart(trend)
         return
 
     # ---- VISUAL ----
-    st.line_chart(plot_df.set_index("session_date")["cei_score"])
+    st.line_chart(trend)
 
     # ---- INTERPRETATION ----
-    status, message = interpret_engagement(plot_df["cei_score"])
+    status, message = interpret_engagement(trend.to_numpy())
 
     if status == "green":
         st.success(message)
@@ -335,12 +613,14 @@ def teacher_dashboard():
 # -----------------------------
 page = st.sidebar.radio(
     "Navigate",
-    ["Class Setup", "Daily Reflection", "Dashboard"]
+    ["Class Setup", "Daily Reflection", "Import Reflections", "Dashboard"]
 )
 
 if page == "Class Setup":
     class_setup()
 elif page == "Daily Reflection":
     daily_reflection()
+elif page == "Import Reflections":
+    import_reflections()
 else:
     teacher_dashboard()